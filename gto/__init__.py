@@ -1,8 +1,34 @@
+import importlib
+from typing import TYPE_CHECKING
+
 import gto.log  # noqa
-from gto import api
 from gto._version import __version__
 from gto.config import CONFIG
-from gto.index import RepoIndexManager
-from gto.registry import GitRegistry
+
+if TYPE_CHECKING:
+    from gto import api
+    from gto.index import RepoIndexManager
+    from gto.registry import GitRegistry
 
 __all__ = ["api", "CONFIG", "RepoIndexManager", "GitRegistry", "__version__"]
+
+# heavy modules are imported on first access, so `import gto` stays cheap
+_lazy_attrs = {
+    "api": ("gto.api", None),
+    "RepoIndexManager": ("gto.index", "RepoIndexManager"),
+    "GitRegistry": ("gto.registry", "GitRegistry"),
+}
+
+
+def __getattr__(name):
+    if name not in _lazy_attrs:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = _lazy_attrs[name]
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
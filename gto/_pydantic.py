@@ -1,30 +1,36 @@
+from importlib.util import find_spec
+
 __all__ = [
     "BaseModel",
     "BaseSettings",
+    "PrivateAttr",
     "ValidationError",
     "parse_obj_as",
     "validator",
     "InitSettingsSource",
 ]
 
-
-try:
+# pydantic 2 (and latest 1.10) ship the v1 API as `pydantic.v1`
+if find_spec("pydantic.v1") is not None:
     from pydantic.v1 import (
         BaseModel,
         BaseSettings,
+        PrivateAttr,
         ValidationError,
         parse_obj_as,
         validator,
     )
     from pydantic.v1.env_settings import InitSettingsSource
-except ImportError:
-    from pydantic import (  # type: ignore[no-redef,assignment]
+else:
+    # older pydantic 1 only; pylint resolves these against the installed pydantic 2
+    from pydantic import (  # type: ignore[no-redef,assignment] # pylint: disable=no-name-in-module
         BaseModel,
         BaseSettings,
+        PrivateAttr,
         ValidationError,
         parse_obj_as,
         validator,
     )
-    from pydantic.env_settings import (  # type: ignore[no-redef,assignment]
+    from pydantic.env_settings import (  # type: ignore[no-redef,assignment] # pylint: disable=no-name-in-module
         InitSettingsSource,
     )
@@ -1,11 +1,12 @@
-from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Dict, Optional, Tuple, Type, Union
 
-from funcy import distinct
 from scmrepo.exceptions import RevError
 from scmrepo.git import Git
 
+from gto.base import BaseEvent
 from gto.constants import (
     ARTIFACT,
     ASSIGNMENTS_PER_VERSION,
@@ -24,7 +25,7 @@ from gto.registry import GitRegistry
 from gto.tag import parse_name as parse_tag_name
 
 
-def _is_gto_repo(repo: Union[str, Path, Git]):
+def _is_gto_repo(repo: Union[str, Path, Git, GitRegistry]):
     """Check if repo is a gto repo"""
     try:
         with GitRegistry.from_url(repo) as reg:
@@ -33,13 +34,15 @@ def _is_gto_repo(repo: Union[str, Path, Git]):
         return False
 
 
-def _get_state(repo: Union[str, Path, Git]):
+def _get_state(repo: Union[str, Path, Git, GitRegistry]):
     """Show current registry state"""
     with GitRegistry.from_url(repo) as reg:
         return reg.get_state()
 
 
-def get_stages(repo: Union[str, Path, Git], allowed: bool = False, used: bool = False):
+def get_stages(
+    repo: Union[str, Path, Git, GitRegistry], allowed: bool = False, used: bool = False
+):
     with GitRegistry.from_url(repo) as reg:
         return reg.get_stages(allowed=allowed, used=used)
 
@@ -49,19 +52,21 @@ def describe(
 ) -> Optional[Artifact]:
     """Find enrichments for the artifact"""
     shortcut = parse_shortcut(name)
-    if shortcut.shortcut:
-        if rev:
-            raise WrongArgs("Either specify revision or use naming shortcut.")
-        versions = show(repo, name)
-        if len(versions) == 0:  # nothing found
-            return None
-        if len(versions) > 1:
-            raise NotImplementedInGTO(
-                "Ambiguous naming shortcut: multiple variants found."
-            )
-        rev = versions[0]["commit_hexsha"]
+    if shortcut.shortcut and rev:
+        raise WrongArgs("Either specify revision or use naming shortcut.")
 
+    # a remote repo is cloned once and used both to resolve the shortcut and to read
     with RepoIndexManager.from_url(repo) as index:
+        if shortcut.shortcut:
+            with GitRegistry.from_scm(index.scm) as reg:
+                versions = show(reg, name)
+            if len(versions) == 0:  # nothing found
+                return None
+            if len(versions) > 1:
+                raise NotImplementedInGTO(
+                    "Ambiguous naming shortcut: multiple variants found."
+                )
+            rev = versions[0]["commit_hexsha"]
         artifact = index.get_commit_index(rev or index.scm.get_rev()).state.get(
             shortcut.name
         )
@@ -233,7 +238,7 @@ def parse_tag(name: str):
 
 
 def find_latest_version(
-    repo: Union[str, Path, Git],
+    repo: Union[str, Path, Git, GitRegistry],
     name: str,
     all: bool = False,
     registered: bool = True,
@@ -244,7 +249,7 @@ def find_latest_version(
 
 
 def find_versions_in_stage(
-    repo: Union[str, Path, Git],
+    repo: Union[str, Path, Git, GitRegistry],
     name: str,
     stage: str,
     assignments_per_version=ASSIGNMENTS_PER_VERSION,
@@ -263,14 +268,14 @@ def find_versions_in_stage(
         )
 
 
-def check_ref(repo: Union[str, Path, Git], ref: str):
+def check_ref(repo: Union[str, Path, Git, GitRegistry], ref: str):
     """Find out what have been registered/assigned in the provided ref"""
     with GitRegistry.from_url(repo) as reg:
         return reg.check_ref(ref)
 
 
 def show(
-    repo: Union[str, Path, Git],
+    repo: Union[str, Path, Git, GitRegistry],
     name: Optional[str] = None,
     truncate_hexsha=False,
     registered_only=False,
@@ -279,11 +284,15 @@ def show(
     versions_per_stage=VERSIONS_PER_STAGE,
     sort=VersionSort.Timestamp,
     table: bool = False,
+    raw: bool = False,
 ):
+    if raw and not name:
+        raise WrongArgs("'raw' can be used only when artifact name is given")
     return (
         _show_versions(
             repo,
             name=name,
+            raw=raw,
             registered_only=registered_only,
             deprecated=deprecated,
             assignments_per_version=assignments_per_version,
@@ -307,7 +316,7 @@ def show(
 
 
 def _show_registry(
-    repo: Union[str, Path, Git],
+    repo: Union[str, Path, Git, GitRegistry],
     registered_only=False,
     deprecated=False,
     assignments_per_version: Optional[int] = None,
@@ -317,57 +326,76 @@ def _show_registry(
     truncate_hexsha: bool = False,
 ):
     """Show current registry state"""
+    # called for every cell, so no extra branching or Python-level call inside
+    format_hexsha: Callable[[str], str] = (
+        itemgetter(slice(7)) if truncate_hexsha else str
+    )
 
-    def format_hexsha(hexsha):
-        return hexsha[:7] if truncate_hexsha else hexsha
-
-    with GitRegistry.from_url(repo) as reg:
-        stages = list(reg.get_stages())
-        models_state = {
-            o.artifact: {
-                "version": format_hexsha(
-                    o.get_latest_version(registered_only=True).version
-                )
-                if o.get_latest_version(registered_only=True)
-                else None,
-                "stage": {
-                    name: ", ".join(
-                        [
-                            format_hexsha(s.version)
-                            for s in o.get_vstages(
-                                registered_only=registered_only,
-                                assignments_per_version=assignments_per_version,
-                                versions_per_stage=versions_per_stage,
-                                sort=sort,
-                            ).get(name, [])
-                        ]
+    with GitRegistry.from_url(repo) as reg, reg.cached_state():
+        no_stages = dict.fromkeys(reg.get_stages())
+        stage_columns = [f"#{name}" for name in no_stages]
+        models_state = {}
+        rows = []
+        for o in reg.get_artifacts().values():
+            is_active = o.is_active
+            if not (is_active or deprecated):
+                continue
+            latest = o.get_latest_version(registered_only=True)
+            vstages = o.get_vstages(
+                registered_only=registered_only,
+                assignments_per_version=assignments_per_version,
+                versions_per_stage=versions_per_stage,
+                sort=sort,
+            )
+            version = format_hexsha(latest.version) if latest else None
+            # only stages the artifact has are formatted, the rest stay None
+            stage_versions = no_stages.copy()
+            for name, stage_vstages in vstages.items():
+                if name in stage_versions:
+                    stage_versions[name] = (
+                        ", ".join([format_hexsha(s.version) for s in stage_vstages])
+                        or None
                     )
-                    or None
-                    for name in stages
-                },
-                "registered": o.is_registered,
-                "active": o.is_active,
-            }
-            for o in reg.get_artifacts().values()
-            if o.is_active or deprecated
-        }
+            if table:
+                # rows are built right away, without the nested dict
+                row = {
+                    "name": o.artifact
+                    if o.is_registered
+                    else mark_artifact_unregistered(o.artifact),
+                    "latest": version,
+                }
+                row.update(zip(stage_columns, stage_versions.values()))
+                rows.append((o.artifact, row))
+            else:
+                models_state[o.artifact] = {
+                    "version": version,
+                    "stage": stage_versions,
+                    "registered": o.is_registered,
+                    "active": is_active,
+                }
 
     if not table:
         return models_state
 
-    return [
-        OrderedDict(
-            zip(
-                ["name", "latest"] + [f"#{e}" for e in stages],
-                [
-                    name if d["registered"] else mark_artifact_unregistered(name),
-                    d["version"],
-                ]
-                + [d["stage"][name] for name in stages],
-            ),
-        )
-        for name, d in sorted(models_state.items())
-    ], "keys"
+    return [row for _, row in sorted(rows, key=itemgetter(0))], "keys"
+
+
+def _truncate_hexsha(hexsha: str) -> str:
+    return hexsha[:7] if is_hexsha(hexsha) else hexsha
+
+
+def _version_row(version, vstages) -> dict:
+    """Fields of `Version.dict_state()` used to filter versions and build the table"""
+    authoring_event = version.authoring_event
+    return {
+        "artifact": version.artifact,
+        "version": version.version,
+        "commit_hexsha": version.commit_hexsha,
+        "created_at": authoring_event.created_at,
+        "ref": authoring_event.ref,
+        "registrations": version.registrations,
+        "stages": [{"stage": vstage.stage} for vstage in vstages],
+    }
 
 
 def _get_versions(
@@ -377,33 +405,43 @@ def _get_versions(
     assignments_per_version,
     versions_per_stage,
     sort,
+    limit: Optional[int] = None,
+    table: bool = False,
 ):
-    versions = []
+    if not (artifact.is_active or deprecated):
+        return []
     stages = artifact.get_vstages(
         registered_only=registered_only,
         assignments_per_version=assignments_per_version,
         versions_per_stage=versions_per_stage,
         sort=sort,
     )
+    # group vstages by version once instead of scanning all of them per version
+    vstages_by_version: Dict[str, list] = {}
+    for vstages in stages.values():
+        for vstage in vstages:
+            vstages_by_version.setdefault(vstage.version, []).append(vstage)
+    versions = []
     for v in artifact.get_versions(
         active_only=not deprecated,
         include_non_explicit=not registered_only,
         include_discovered=True,
     ):
-        v = v.dict_state()
-        v["stages"] = [
-            vstage.dict_state()
-            for vstages in stages.values()
-            for vstage in vstages
-            if vstage.version == v["version"]
-        ]
-        if artifact.is_active or deprecated:
+        vstages = vstages_by_version.get(v.version, [])
+        if table:
+            # the table needs few fields, so skip serializing the whole model
+            versions.append(_version_row(v, vstages))
+        else:
+            v = v.dict_state()
+            v["stages"] = [vstage.dict_state() for vstage in vstages]
             versions.append(v)
+        if limit is not None and len(versions) >= limit:
+            break
     return versions
 
 
 def _show_versions(  # pylint: disable=too-many-locals  # noqa: C901
-    repo: Union[str, Path, Git],
+    repo: Union[str, Path, Git, GitRegistry],
     name: str,
     ref: Optional[str] = None,
     raw: bool = False,
@@ -417,12 +455,16 @@ def _show_versions(  # pylint: disable=too-many-locals  # noqa: C901
 ):
     """List versions of artifact"""
 
-    def format_hexsha(hexsha):
-        return hexsha[:7] if truncate_hexsha and is_hexsha(hexsha) else hexsha
+    format_hexsha: Callable[[str], str] = _truncate_hexsha if truncate_hexsha else str
 
     shortcut = parse_shortcut(name)
     if shortcut.shortcut and ref:
         raise WrongArgs("Cannot specify both shortcut and ref")
+    if raw and (shortcut.shortcut or ref or table or registered_only or deprecated):
+        raise WrongArgs(
+            "'raw' returns all versions unfiltered, "
+            "it can't be used with a shortcut, ref, filters or 'table'"
+        )
 
     with GitRegistry.from_url(repo) as reg:
         if raw:
@@ -437,6 +479,9 @@ def _show_versions(  # pylint: disable=too-many-locals  # noqa: C901
             assignments_per_version,
             versions_per_stage,
             sort,
+            # only the first version is needed for the `latest` shortcut
+            limit=1 if shortcut.latest else None,
+            table=table,
         )
         if ref:
             try:
@@ -456,39 +501,41 @@ def _show_versions(  # pylint: disable=too-many-locals  # noqa: C901
     if not table:
         return versions
 
-    first_keys = ["artifact", "version", "stage"]
+    # all versions belong to the same artifact
+    artifact_name = (
+        artifact.artifact
+        if artifact.is_registered
+        else mark_artifact_unregistered(artifact.artifact)
+    )
     versions_ = []
     for v in versions:
-        v["artifact"] = (
-            v["artifact"]
-            if artifact.is_registered
-            else mark_artifact_unregistered(v["artifact"])
-        )
-        v["version"] = format_hexsha(v["version"])
-        v["stage"] = ", ".join(
-            distinct(  # TODO: remove? no longer necessary
-                s["stage"] for s in v["stages"]
-            )
-        )
-        v["commit_hexsha"] = format_hexsha(v["commit_hexsha"])
-        v["ref"] = format_hexsha(v["ref"])
         if len(v["registrations"]) > 1:
             raise NotImplementedInGTO(
                 "Multiple registrations are not supported currently. How you got in here?"
             )
-        for key in list(v.keys()):
-            if key not in first_keys + ["created_at", "ref"]:
-                del v[key]
-        v = OrderedDict(
-            [(key, v[key]) for key in first_keys]
-            + [(key, v[key]) for key in v if key not in first_keys]
+        versions_.append(
+            {
+                "artifact": artifact_name,
+                "version": format_hexsha(v["version"]),
+                "stage": ", ".join(
+                    # TODO: remove dedup? no longer necessary
+                    dict.fromkeys(s["stage"] for s in v["stages"])
+                ),
+                "created_at": v["created_at"],
+                "ref": format_hexsha(v["ref"]),
+            }
         )
-        versions_.append(v)
     return versions_, "keys"
 
 
+@lru_cache(maxsize=None)
+def _event_fields(event_class: Type[BaseEvent]) -> Tuple[bool, bool]:
+    """Whether events of this class have a version and a stage"""
+    return "version" in event_class.__fields__, "stage" in event_class.__fields__
+
+
 def history(
-    repo: Union[str, Path, Git],
+    repo: Union[str, Path, Git, GitRegistry],
     artifact: Optional[str] = None,
     # action: str = None,
     ascending: bool = False,
@@ -497,37 +544,37 @@ def history(
 ):
     with GitRegistry.from_url(repo) as reg:
         artifacts = reg.get_artifacts()
+    if artifact:
+        artifacts = {artifact: artifacts[artifact]} if artifact in artifacts else {}
+
+    format_hexsha: Callable[[str], str] = _truncate_hexsha if truncate_hexsha else str
+
+    events = []
+    for o in artifacts.values():
+        for e in o.get_tag_events():
+            commit = format_hexsha(e.commit_hexsha)
+            ref = e.ref
+            has_version, has_stage = _event_fields(e.__class__)
+            events.append(
+                {
+                    "timestamp": e.created_at,
+                    "artifact": e.artifact,
+                    "event": e.event,
+                    "priority": e.priority,
+                    "version": format_hexsha(e.version) if has_version else None,
+                    "stage": e.stage if has_stage else None,
+                    "commit": commit,
+                    "author": e.author,
+                    "author_email": e.author_email,
+                    "message": e.message,
+                    # ref is either a tag name or the commit hexsha
+                    "ref": commit if ref == e.commit_hexsha else ref,
+                }
+            )
 
-    def format_hexsha(hexsha):
-        return hexsha[:7] if truncate_hexsha and is_hexsha(hexsha) else hexsha
-
-    events = [
-        OrderedDict(
-            timestamp=e.created_at,
-            artifact=e.artifact,
-            event=type(e).__name__.lower(),
-            priority=e.priority,
-            version=format_hexsha(e.version) if hasattr(e, "version") else None,
-            stage=getattr(e, "stage", None),
-            commit=format_hexsha(e.commit_hexsha),
-            author=e.author,
-            author_email=e.author_email,
-            message=e.message,
-            ref=format_hexsha(e.ref) if e.ref == e.commit_hexsha else e.ref,
-        )
-        for o in artifacts.values()
-        for e in o.get_events()
-        if type(e).__name__.lower() != "commit"
-    ]
-
-    events = sorted(
-        events,
-        key=lambda x: (x["timestamp"], x["priority"]),
-    )
+    events.sort(key=itemgetter("timestamp", "priority"))
     if not ascending:
         events.reverse()
-    if artifact:
-        events = [event for event in events if event["artifact"] == artifact]
     if not table:
         return events
     keys_order = [
@@ -539,8 +586,7 @@ def history(
         COMMIT,
         "ref",
     ]
-    keys_order = [c for c in keys_order if any(c in event for event in events)]
-    events = [
-        OrderedDict((key, event.get(key)) for key in keys_order) for event in events
-    ]
+    present = set().union(*events)
+    keys_order = [c for c in keys_order if c in present]
+    events = [{key: event.get(key) for key in keys_order} for event in events]
     return events, "keys"
@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Union
 
 from scmrepo.git import Git
@@ -12,7 +13,7 @@ from gto.constants import (
 )
 from gto.versions import SemVer
 
-from ._pydantic import BaseModel
+from ._pydantic import BaseModel, PrivateAttr
 from .exceptions import (
     ArtifactNotFound,
     ManyVersions,
@@ -23,6 +24,19 @@ from .exceptions import (
 )
 
 
+@lru_cache(maxsize=None)
+def _event_name(event_class: type) -> str:
+    return event_class.__name__.lower()
+
+
+def _sorted(items, key, ascending=True) -> list:
+    """Same as `sorted(items, key=key)[:: 1 if ascending else -1]`, without a copy"""
+    result = sorted(items, key=key)
+    if not ascending:
+        result.reverse()
+    return result
+
+
 # EVENTS: deprecation, registration, deregistration, assignment, unassignment
 class BaseEvent(BaseModel):
     priority: int
@@ -38,7 +52,7 @@ class BaseEvent(BaseModel):
 
     @property
     def event(self):
-        return self.__class__.__name__.lower()
+        return _event_name(self.__class__)
 
     def dict_state(self, exclude=None):
         state = self.dict(exclude=exclude)
@@ -212,10 +226,11 @@ class VStage(BaseObject):
     def get_events(
         self, direct=True, indirect=True, ascending=False
     ) -> Sequence[BaseEvent]:  # pylint: disable=unused-argument
-        return sorted(
+        return _sorted(
             self.assignments + self.unassignments if direct else [],  # type: ignore
             key=lambda e: e.created_at,
-        )[:: 1 if ascending else -1]
+            ascending=ascending,
+        )
 
     @property
     def is_active(self):
@@ -261,7 +276,7 @@ class Version(BaseObject):
         return event
 
     def get_events(self, direct=True, indirect=True, ascending=False):
-        return sorted(
+        return _sorted(
             (self.registrations + self.deregistrations if direct else [])
             + (
                 self.enrichments
@@ -270,7 +285,8 @@ class Version(BaseObject):
                 else []
             ),
             key=lambda e: e.created_at,
-        )[:: 1 if ascending else -1]
+            ascending=ascending,
+        )
 
     @property
     def is_active(self):
@@ -311,22 +327,24 @@ class Version(BaseObject):
         return SemVer(self.version)
 
     def get_vstage(self, stage, create_new=False):
-        if create_new and stage not in self.stages:
-            self.stages[stage] = VStage(
+        vstage = self.stages.get(stage)
+        if vstage is None:
+            if not create_new:
+                raise NoStageForVersion(self.artifact, self.version, stage)
+            vstage = self.stages[stage] = VStage(
                 artifact=self.artifact,
                 version=self.version,
                 stage=stage,
                 commit_hexsha=self.commit_hexsha,
             )
-        if stage in self.stages:
-            return self.stages[stage]
-        raise NoStageForVersion(self.artifact, self.version, stage)
+        return vstage
 
     def get_vstages(self, active_only=True, ascending=False):
-        return sorted(
+        return _sorted(
             [s for s in self.stages.values() if not active_only or s.is_active],
             key=lambda s: s.activated_at,
-        )[:: 1 if ascending else -1]
+            ascending=ascending,
+        )
 
     def dict_state(self, exclude=None, assignments_per_version=ASSIGNMENTS_PER_VERSION):
         if assignments_per_version < -1:
@@ -358,22 +376,25 @@ def sort_versions(
     sort = sort if isinstance(sort, VersionSort) else VersionSort[sort]
     if sort == VersionSort.SemVer:
         # sorting SemVer versions in a right way
-        sorted_versions = sorted(
+        sorted_versions = _sorted(
             (v for v in versions if SemVer.is_valid(get(v, version))),
             key=lambda x: SemVer(get(x, version)),
-        )[:: 1 if ascending else -1]
+            ascending=ascending,
+        )
         # sorting hexsha versions alphabetically
         sorted_versions.extend(
-            sorted(
+            _sorted(
                 (v for v in versions if not SemVer.is_valid(get(v, version))),
                 key=lambda x: get(x, version),
-            )[:: 1 if ascending else -1]
+                ascending=ascending,
+            )
         )
     else:
-        sorted_versions = sorted(
+        sorted_versions = _sorted(
             versions,
             key=lambda x: get(x, timestamp),
-        )[:: 1 if ascending else -1]
+            ascending=ascending,
+        )
     return sorted_versions
 
 
@@ -381,6 +402,10 @@ class Artifact(BaseObject):
     versions: List[Version]
     creations: List[Creation] = []
     deprecations: List[Deprecation] = []
+    _versions_by_name: Dict[str, List[Version]] = PrivateAttr(default_factory=dict)
+    _versions_by_hexsha: Dict[str, List[Version]] = PrivateAttr(default_factory=dict)
+    _indexed_versions: Optional[List[Version]] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=0)
 
     def add_event(self, event: BaseEvent):
         if event in self.get_events():
@@ -406,11 +431,29 @@ class Artifact(BaseObject):
     def get_events(
         self, direct=True, indirect=True, ascending=False
     ) -> Sequence[BaseEvent]:
-        return sorted(
+        return _sorted(
             (self.creations + self.deprecations if direct else [])  # type: ignore
             + ([e for v in self.versions for e in v.get_events()] if indirect else []),
             key=lambda e: e.created_at,
-        )[:: 1 if ascending else -1]
+            ascending=ascending,
+        )
+
+    def get_tag_events(self) -> List[BaseEvent]:
+        """Return events created from git tags without sorting them.
+
+        Events created at the same time come in the same order as in `get_events()`,
+        so a stable sort of this list gives the same result as sorting `get_events()`.
+        """
+        events: List[BaseEvent] = []
+        for version in reversed(self.versions):
+            events.extend(version.registrations)
+            events.extend(version.deregistrations)
+            for vstage in version.stages.values():
+                events.extend(reversed(vstage.unassignments))
+                events.extend(reversed(vstage.assignments))
+        events.extend(reversed(self.deprecations))
+        events.extend(reversed(self.creations))
+        return events
 
     @property
     def is_active(self):
@@ -499,21 +542,46 @@ class Artifact(BaseObject):
         if sort == VersionSort.Timestamp:
             assignments = sorted(assignments, key=lambda a: a.created_at)[::-1]
         for a in assignments:
-            if a.stage not in stages:
-                stages[a.stage] = []
+            stage = stages.setdefault(a.stage, [])
             if (
                 versions_per_stage > -1  # pylint: disable=chained-comparison
-                and len(stages[a.stage]) >= versions_per_stage
+                and len(stage) >= versions_per_stage
             ):
                 continue
-            if a.version not in [i.version for i in stages[a.stage]]:
-                stages[a.stage].append(a)
+            if a.version not in [i.version for i in stage]:
+                stage.append(a)
         return stages
 
     @property
     def discovered(self):
         return any(not v.discovered for v in self.versions)
 
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # `copy()` shares private attrs, but each copy must index its own versions
+        artifact = super()._copy_and_set_values(values, fields_set, deep=deep)
+        Artifact._reset_versions_index(artifact)
+        return artifact
+
+    def _reset_versions_index(self):
+        self._versions_by_name = {}
+        self._versions_by_hexsha = {}
+        self._indexed_versions = None
+        self._indexed_count = 0
+
+    def _index_versions(self):
+        """Sync name and hexsha lookups with `versions` (which are append-only)"""
+        versions = self.versions
+        replaced = self._indexed_versions is not versions
+        if replaced or self._indexed_count > len(versions):
+            self._reset_versions_index()
+            self._indexed_versions = versions
+        by_name: Dict[str, List[Version]] = self._versions_by_name
+        by_hexsha: Dict[str, List[Version]] = self._versions_by_hexsha
+        for v in versions[self._indexed_count :]:
+            by_name.setdefault(v.version, []).append(v)
+            by_hexsha.setdefault(v.commit_hexsha, []).append(v)
+        self._indexed_count = len(versions)
+
     def find_version(
         self,
         name: Optional[str] = None,
@@ -523,9 +591,18 @@ class Artifact(BaseObject):
         include_discovered=False,
         create_new=False,
     ) -> Union[None, Version, List[Version]]:
+        self._index_versions()
+        if commit_hexsha:
+            by_hexsha: Dict[str, List[Version]] = self._versions_by_hexsha
+            candidates = by_hexsha.get(commit_hexsha, [])
+        elif name:
+            by_name: Dict[str, List[Version]] = self._versions_by_name
+            candidates = by_name.get(name, [])
+        else:
+            candidates = self.versions
         versions = [
             v
-            for v in self.versions
+            for v in candidates
             if (v.version == name if name else True)
             and (v.commit_hexsha == commit_hexsha if commit_hexsha else True)
             and (True if include_discovered else not v.discovered)
@@ -579,12 +656,12 @@ class BaseRegistryState(BaseModel):
         return self.artifacts
 
     def find_artifact(self, name: str, create_new=False) -> Artifact:
-        if name not in self.artifacts:
-            if create_new:
-                self.artifacts[name] = Artifact(artifact=name, versions=[])
-            else:
+        artifact = self.artifacts.get(name)
+        if artifact is None:
+            if not create_new:
                 raise ArtifactNotFound(name)
-        return self.artifacts[name]
+            artifact = self.artifacts[name] = Artifact(artifact=name, versions=[])
+        return artifact
 
     @property
     def unique_stages(self):
@@ -612,8 +689,9 @@ class BaseRegistryState(BaseModel):
             assignments_per_version=assignments_per_version,
             versions_per_stage=versions_per_stage,
         )
-        if stage in assigned:
-            return assigned[stage]
+        vstages = assigned.get(stage)
+        if vstages is not None:
+            return vstages
         if raise_if_not_found:
             raise ValueError(f"Stage {stage} not found for {name}")
         return None
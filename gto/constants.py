@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 from gto.exceptions import ValidationError
@@ -58,10 +59,11 @@ shortcut_re = re.compile(
     f"^(?P<artifact>{fullname})(#(?P<stage>{name})|@(?P<version>latest|greatest|v{semver}))$"
 )
 git_hexsha_re = re.compile(r"^[0-9a-fA-F]{40}$")
+semver_re = re.compile(f"^v{semver}$")
 
 
 def is_hexsha(value):
-    return bool(git_hexsha_re.search(value))
+    return git_hexsha_re.match(value) is not None
 
 
 def check_string_is_valid(value, regex=name_re):
@@ -92,9 +94,14 @@ class Shortcut(BaseModel):
     latest: bool = False
     shortcut: bool = False
 
+    class Config:
+        # instances are shared by `parse_shortcut` cache
+        allow_mutation = False
 
+
+@lru_cache(maxsize=1024)
 def parse_shortcut(value):
-    match = re.search(shortcut_re, value)
+    match = shortcut_re.match(value)
     if match:
         value = match["artifact"]
         if match["stage"]:
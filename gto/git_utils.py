@@ -1,6 +1,8 @@
+import datetime
 import logging
 import os.path
 from contextlib import contextmanager
+from functools import lru_cache
 from itertools import chain
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -34,7 +36,7 @@ class RemoteRepoMixin:
     @contextmanager
     def from_url(
         cls,
-        url_or_scm: Union[str, Path, Git],
+        url_or_scm: Union[str, Path, Git, "RemoteRepoMixin"],
         config: Optional[RegistryConfig] = None,
         branch=None,
     ):
@@ -42,14 +44,22 @@ class RemoteRepoMixin:
             with cls.from_scm(url_or_scm) as obj:
                 yield obj
             return
-        url_or_scm = str(url_or_scm)
-        if os.path.exists(url_or_scm):
-            scm = Git(url_or_scm)
+        if isinstance(url_or_scm, cls):
+            # already opened, e.g. to run several read operations on one registry
+            if config is not None or branch:
+                raise WrongArgs(
+                    "config and branch can't be set for an already opened repo"
+                )
+            yield url_or_scm
+            return
+        url = str(url_or_scm)
+        if os.path.exists(url):
+            scm = Git(url)
             try:
                 scm.dir  # noqa: B018
             except SCMError as e:
                 scm.close()
-                raise NoRepo(url_or_scm) from e
+                raise NoRepo(url) from e
             if branch:
                 raise WrongArgs("branch can only be set for remote repos")
             try:
@@ -58,7 +68,7 @@ class RemoteRepoMixin:
             finally:
                 scm.close()
         else:
-            with cloned_git_repo(url_or_scm) as scm:
+            with cloned_git_repo(url) as scm:
                 if branch:
                     scm.checkout(branch)
                 with cls.from_scm(scm=scm, config=config, cloned=True) as obj:
@@ -118,6 +128,18 @@ def cloned_git_repo(url: str) -> Iterator[Git]:
             scm.close()
 
 
+@lru_cache(maxsize=None)
+def _timezone(offset: int) -> datetime.timezone:
+    return datetime.timezone(datetime.timedelta(seconds=offset))
+
+
+def git_datetime(time: int, offset: int) -> datetime.datetime:
+    """Same as `GitTag.tag_datetime` and `GitCommit.commit_datetime` in scmrepo,
+    but timezone objects are shared instead of being created for every object.
+    """
+    return datetime.datetime.fromtimestamp(time, tz=_timezone(offset))
+
+
 def git_push_tag(
     scm: Git,
     tag_name: str,
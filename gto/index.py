@@ -46,7 +46,7 @@ from gto.exceptions import (
     WrongArtifactsYaml,
 )
 from gto.ext import EnrichmentInfo, EnrichmentReader
-from gto.git_utils import RemoteRepoMixin
+from gto.git_utils import RemoteRepoMixin, git_datetime
 from gto.ui import echo
 
 from ._pydantic import BaseModel, ValidationError, parse_obj_as, validator
@@ -475,9 +475,18 @@ class EnrichmentManager(BaseManager, RemoteRepoMixin):
 
     def describe(self, name: str, rev: Optional[str] = None) -> List[EnrichmentInfo]:
         enrichments = self.config.enrichments
-        res = []
         gto_enrichment = enrichments.pop("gto")
         gto_info = gto_enrichment.describe(self.scm, name, rev)
+        return self._describe(gto_info, rev, enrichments)
+
+    def _describe(
+        self,
+        gto_info: Optional[EnrichmentInfo],
+        rev,
+        enrichments: Dict[str, EnrichmentReader],
+    ) -> List[EnrichmentInfo]:
+        """Add other enrichments to the GTO one found for the artifact"""
+        res: List[EnrichmentInfo] = []
         if gto_info:
             res.append(gto_info)
             path = gto_info.get_path()  # type: ignore
@@ -509,36 +518,65 @@ class EnrichmentManager(BaseManager, RemoteRepoMixin):
         state: BaseRegistryState,
         all_branches=False,
         all_commits=False,
+        name: Optional[str] = None,
     ) -> BaseRegistryState:
+        """Add commits and enrichments to the state.
+        If `name` is given, artifacts discovered under other names are skipped"""
+        # versions of different artifacts often share a commit
+        commits: Dict[str, GitCommit] = {}
+        enrichments = self.config.enrichments
+        enrichments.pop("gto", None)
+        # artifacts.yaml is read once per commit for all artifacts in it
+        gto_infos: Dict[str, Dict[str, GTOInfo]] = {}
+
+        def discover(commit: GitCommit) -> Dict[str, GTOInfo]:
+            infos = gto_infos.get(commit.hexsha)
+            if infos is None:
+                infos = gto_infos[commit.hexsha] = GTOEnrichment().discover(
+                    self.scm, commit
+                )
+            return infos
+
         # processing registered artifacts and versions first
         for artifact in state.get_artifacts().values():
             for version in artifact.versions:
-                commit = self.scm.resolve_commit(version.commit_hexsha)
-                enrichments = self.describe(
-                    artifact.artifact,
+                commit = commits.get(version.commit_hexsha)
+                if commit is None:
+                    commit = commits[version.commit_hexsha] = self.scm.resolve_commit(
+                        version.commit_hexsha
+                    )
+                version_enrichments = self._describe(
+                    discover(commit).get(artifact.artifact),
                     # faster to make git.Reference here
                     rev=commit,
+                    enrichments=enrichments,
                 )
                 version.add_event(
                     EnrichmentEvent(
                         artifact=artifact.artifact,
                         version=version.version,
-                        created_at=commit.commit_datetime,
+                        created_at=git_datetime(
+                            commit.commit_time, commit.commit_time_offset
+                        ),
                         author=commit.author_name,
                         author_email=commit.author_email,
                         commit_hexsha=commit.hexsha,
                         message=commit.message,
                         committer=commit.committer_name,
                         committer_email=commit.committer_email,
-                        enrichments=enrichments,
+                        enrichments=version_enrichments,
                     )
                 )
                 state.update_artifact(artifact)
         for commit in self.get_commits(
             all_branches=all_branches, all_commits=all_commits
         ):
-            for art_name in GTOEnrichment().discover(self.scm, commit):
-                enrichments = self.describe(art_name, rev=commit)
+            for art_name, gto_info in discover(commit).items():
+                if name and art_name != name:
+                    continue
+                version_enrichments = self._describe(
+                    gto_info, rev=commit, enrichments=enrichments
+                )
                 artifact = state.find_artifact(art_name, create_new=True)
                 version = artifact.find_version(
                     commit_hexsha=commit.hexsha, create_new=True
@@ -547,14 +585,16 @@ class EnrichmentManager(BaseManager, RemoteRepoMixin):
                     EnrichmentEvent(
                         artifact=artifact.artifact,
                         version=version.version,
-                        created_at=commit.commit_datetime,
+                        created_at=git_datetime(
+                            commit.commit_time, commit.commit_time_offset
+                        ),
                         author=commit.author_name,
                         author_email=commit.author_email,
                         commit_hexsha=commit.hexsha,
                         message=commit.message,
                         committer=commit.committer_name,
                         committer_email=commit.committer_email,
-                        enrichments=enrichments,
+                        enrichments=version_enrichments,
                     )
                 )
                 state.update_artifact(artifact)
@@ -579,7 +619,7 @@ class GTOEnrichment(EnrichmentReader):
     source: str = "gto"
 
     def discover(  # pylint: disable=no-self-use
-        self, url_or_scm: Union[str, Git], rev: str
+        self, url_or_scm: Union[str, Git], rev: Union[str, GitCommit]
     ) -> Dict[str, GTOInfo]:
         with RepoIndexManager.from_url(url_or_scm) as index:
             index = index.get_commit_index(rev)
@@ -1,7 +1,7 @@
 import logging
 import os
 from contextlib import contextmanager
-from typing import List, Optional, TypeVar, cast
+from typing import Dict, List, Optional, Tuple, TypeVar, cast
 
 from funcy import distinct
 from scmrepo.git import Git
@@ -31,12 +31,13 @@ from gto.tag import (
     TagStageManager,
     TagVersionManager,
     delete_tag,
+    find,
     parse_name,
 )
 from gto.ui import echo
 from gto.versions import SemVer
 
-from ._pydantic import BaseModel
+from ._pydantic import BaseModel, PrivateAttr
 
 TBaseEvent = TypeVar("TBaseEvent", bound=BaseEvent)
 
@@ -49,6 +50,9 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
     stage_manager: TagStageManager
     enrichment_manager: EnrichmentManager
     config: RegistryConfig
+    _states: Optional[Dict[Tuple[bool, bool], BaseRegistryState]] = PrivateAttr(
+        default=None
+    )
 
     class Config:
         arbitrary_types_allowed = True
@@ -83,19 +87,47 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
             return True
         return False
 
+    @contextmanager
+    def cached_state(self):
+        """Build registry state once and reuse it inside this context.
+        Use it for read-only operations: tags created inside aren't picked up"""
+        if self._states is not None:
+            # already inside `cached_state`
+            yield self
+            return
+        self._states = {}
+        try:
+            yield self
+        finally:
+            self._states = None
+
     def get_state(
         self,
         all_branches=False,
         all_commits=False,
     ) -> BaseRegistryState:
+        if self._states is None:
+            return self._build_state(all_branches, all_commits)
+        key = (all_branches, all_commits)
+        if key not in self._states:
+            self._states[key] = self._build_state(all_branches, all_commits)
+        return self._states[key]
+
+    def _build_state(
+        self, all_branches, all_commits, name: Optional[str] = None
+    ) -> BaseRegistryState:
+        """If `name` is given, only that artifact is indexed"""
         state = BaseRegistryState()
-        state = self.artifact_manager.update_state(state)
-        state = self.version_manager.update_state(state)
-        state = self.stage_manager.update_state(state)
+        # load GTO tags once and share them between managers
+        tags = find(scm=self.scm, name=name)
+        state = self.artifact_manager.update_state(state, tags=tags)
+        state = self.version_manager.update_state(state, tags=tags)
+        state = self.stage_manager.update_state(state, tags=tags)
         state = self.enrichment_manager.update_state(
             state,
             all_branches=all_branches,
             all_commits=all_commits,
+            name=name,
         )
         return state
 
@@ -116,10 +148,12 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
         all_branches=False,
         all_commits=False,
     ):
-        return self.get_state(
-            all_branches=all_branches,
-            all_commits=all_commits,
-        ).find_artifact(
+        if name and self._states is None:
+            # no need to index other artifacts' tags and enrichments
+            state = self._build_state(all_branches, all_commits, name=name)
+        else:
+            state = self.get_state(all_branches=all_branches, all_commits=all_commits)
+        return state.find_artifact(
             name,  # type: ignore
             create_new=create_new,
         )
@@ -295,7 +329,7 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
             )
             if not found_version:
                 raise WrongArgs(f"Version '{version}' is not registered")
-            rev = self.find_commit(name, version)
+            rev = found_version.commit_hexsha
         else:
             found_version = found_artifact.find_version(commit_hexsha=rev)
             if found_version:
@@ -313,7 +347,9 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
                         stdout=stdout,
                         push=push,
                     )
-                found_version = self.find_artifact(name, create_new=True).find_version(
+                    # registration added a tag, so the state needs to be rebuilt
+                    found_artifact = self.find_artifact(name, create_new=True)
+                found_version = found_artifact.find_version(
                     commit_hexsha=rev, create_new=True
                 )
         if (
@@ -424,6 +460,12 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
     ) -> Optional[Deprecation]:
         """Deprecate artifact"""
         assert_fullname_is_valid(name)
+        # forced deprecation of a given rev doesn't read the registry
+        state = (
+            self.get_state()
+            if not force or delete or rev is None
+            else BaseRegistryState()
+        )
         if force:
             if simple:
                 raise WrongArgs("Can't use 'force' with 'simple=True'")
@@ -431,21 +473,20 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
         else:
             if simple is None:
                 simple = True
-            found_artifact = self.find_artifact(name)
-            if not found_artifact.is_active:
+            if not state.find_artifact(name).is_active:
                 raise WrongArgs("Artifact was deprecated already")
         if delete:
             tags = distinct(
                 [
                     e.tag
-                    for e in self.find_artifact(name=name).get_events(ascending=True)
+                    for e in state.find_artifact(name).get_events(ascending=True)
                     if hasattr(e, "tag")
                 ]
             )
             return self._delete_tags(tags, stdout=stdout, push=push)
         if rev is None:
-            if name in self.get_artifacts():
-                rev = self.find_artifact(name=name).get_events()[0].commit_hexsha
+            if name in state.get_artifacts():
+                rev = state.find_artifact(name).get_events()[0].commit_hexsha
             else:
                 rev = "HEAD"
         tag = self.artifact_manager.deprecate(  # type: ignore
@@ -507,7 +548,7 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
         "Find out what was registered/assigned in this ref"
         try:
             name = ""
-            tag_name = ref[len("refs/tags/") :] if ref.startswith("refs/tags/") else ref
+            tag_name = ref.removeprefix("refs/tags/")
             if self.scm.get_tag(tag_name):
                 # check the ref follows the GTO format
                 name = parse_name(tag_name)[NAME]
@@ -550,7 +591,7 @@ class GitRegistry(BaseModel, RemoteRepoMixin):
 
     def latest(self, name: str, all: bool = False, registered: bool = True):
         """Return latest active version for artifact"""
-        artifact = self.get_state().find_artifact(name)
+        artifact = self.find_artifact(name)
         if all:
             return artifact.get_versions(include_non_explicit=not registered)
         return artifact.get_latest_version(registered_only=registered)
@@ -1,13 +1,14 @@
 import datetime
 import os
-import re
+import sys
+from dataclasses import dataclass
 from enum import Enum
-from typing import FrozenSet, Iterable, Optional, Union
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Union
 
 from scmrepo.exceptions import RevError
 from scmrepo.git import Git, GitTag
 
-from ._pydantic import BaseModel
 from .base import (
     Artifact,
     Assignment,
@@ -39,6 +40,7 @@ from .exceptions import (
     TagNotFound,
     UnknownAction,
 )
+from .git_utils import git_datetime
 
 COUNT_DELIMITER = "#"
 
@@ -51,6 +53,16 @@ TagTemplates = {
     Action.UNASSIGN: "{artifact}#{stage}!",
 }
 
+# substrings any tag of that action contains:
+# used to skip parsing tags that can't match in `find`
+TagSubstrings = {
+    Action.DEPRECATE: "@deprecated",
+    Action.REGISTER: "@v",
+    Action.DEREGISTER: "!",
+    Action.ASSIGN: "#",
+    Action.UNASSIGN: "!",
+}
+
 
 def name_tag(
     action: Action,
@@ -72,7 +84,7 @@ def name_tag(
         raise MissingArg(arg="scm")
     counter = 0
     for t in scm.list_tags():
-        parsed = parse_name(t, raise_on_fail=False)  # type: ignore
+        parsed = _parse_name(t)
         if (
             parsed
             and parsed[NAME] == artifact
@@ -80,24 +92,33 @@ def name_tag(
             and parsed[COUNTER] > counter
         ):
             counter = parsed[COUNTER]
-    return f"{tag}{COUNT_DELIMITER}{counter+1}"
+    return f"{tag}{COUNT_DELIMITER}{counter + 1}"
 
 
 def parse_name(name: str, raise_on_fail: bool = True):
-    match = re.search(tag_re, name)
-    if raise_on_fail and not match:
+    parsed = _parse_name(name)
+    if raise_on_fail and not parsed:
         raise InvalidTagName(name)
+    # copy, since the cached result is shared
+    return dict(parsed)
+
+
+@lru_cache(maxsize=2**16)
+def _parse_name(name: str) -> Dict[str, Any]:
+    # the same tag names are parsed many times while the registry is built
+    match = tag_re.match(name)
     if match:
-        parsed = {NAME: tag_to_name(match["artifact"])}
+        # names, versions and stages are used as dict keys over and over
+        parsed: Dict[str, Any] = {NAME: sys.intern(tag_to_name(match["artifact"]))}
         if match["deprecated"]:
             parsed[ACTION] = Action.DEPRECATE
         if match[VERSION]:
-            parsed[VERSION] = match[VERSION]
+            parsed[VERSION] = sys.intern(match[VERSION])
             parsed[ACTION] = (
                 Action.DEREGISTER if match["cancel"] == "!" else Action.REGISTER
             )
         if match[STAGE]:
-            parsed[STAGE] = match[STAGE]
+            parsed[STAGE] = sys.intern(match[STAGE])
             parsed[ACTION] = (
                 Action.UNASSIGN if match["cancel"] == "!" else Action.ASSIGN
             )
@@ -113,28 +134,27 @@ class NAME_REFERENCE(Enum):
 
 
 def parse_name_reference(name: str):
-    parsed = parse_name(name, raise_on_fail=False)
+    parsed = _parse_name(name)
     if not parsed:
         return NAME_REFERENCE.NAME, name
-    return NAME_REFERENCE.TAG, parsed
+    return NAME_REFERENCE.TAG, dict(parsed)
 
 
-class Tag(BaseModel):
+@dataclass(frozen=True)
+class Tag:
     action: Action
     name: str
-    version: Optional[str]
-    stage: Optional[str]
     created_at: datetime.datetime
     tag: GitTag
-
-    class Config:
-        arbitrary_types_allowed = True
+    version: Optional[str] = None
+    stage: Optional[str] = None
+    counter: Optional[int] = None
 
 
 def parse_tag(tag: GitTag):
     return Tag(
         tag=tag,
-        created_at=tag.tag_datetime,
+        created_at=git_datetime(tag.tag_time, tag.tag_time_offset),
         **parse_name(tag.name),
     )
 
@@ -147,18 +167,25 @@ def find(
     scm: Optional[Git] = None,
     sort: str = "by_time",
     tags: Optional[Iterable[GitTag]] = None,
+    presorted: bool = False,
 ):
+    """Find GTO tags matching the filters.
+    If `presorted`, `tags` are expected to be sorted already and keep their order"""
     if isinstance(action, Action):
         action = frozenset([action])
     if scm is None:
         raise MissingArg(arg="scm")
     result = []
-    tag_names = [t.name for t in tags] if tags else scm.list_tags()
+    loaded = {t.name: t for t in tags} if tags is not None else {}
+    tag_names = list(loaded) if tags is not None else scm.list_tags()
+    if name:
+        prefix = name_to_tag(name)
+        tag_names = [t for t in tag_names if t.startswith((f"{prefix}@", f"{prefix}#"))]
+    if action:
+        substrings = {TagSubstrings[a] for a in action if a in TagSubstrings}
+        tag_names = [t for t in tag_names if any(sub in t for sub in substrings)]
     for t in tag_names:
-        try:
-            parsed = parse_name(t)
-        except InvalidTagName:
-            continue
+        parsed = _parse_name(t)
         if (  # pylint: disable=too-many-boolean-expressions
             parsed
             and (not action or parsed[ACTION] in action)
@@ -166,11 +193,13 @@ def find(
             and (not version or parsed.get(VERSION) == version)
             and (not stage or parsed.get(STAGE) == stage)
         ):
-            tag = scm.get_tag(t)
+            tag = loaded.get(t) or scm.get_tag(t)
             # remove lightweight tags
             if isinstance(tag, GitTag):
                 result.append(tag)
     if sort == "by_time":
+        if presorted:
+            return result
         return sorted(result, key=lambda t: t.tag_time)
     raise NotImplementedError(f"Unknown sort: {sort}")
 
@@ -222,82 +251,53 @@ def delete_tag(scm: Git, name: str):
     scm.remove_ref(ref)
 
 
-def index_tag(artifact: Artifact, tag: GitTag) -> Artifact:
+def index_tag(artifact: Artifact, tag: GitTag, mtag: Optional[Tag] = None) -> Artifact:
     event: Union[Deprecation, Registration, Deregistration, Assignment, Unassignment]
-    mtag = parse_tag(tag)
+    if mtag is None:
+        mtag = parse_tag(tag)
+    fields: Dict[str, Any] = {
+        "artifact": mtag.name,
+        "created_at": mtag.created_at,
+        "author": tag.tagger_name,
+        "author_email": tag.tagger_email,
+        "message": tag.message.strip(),
+        "commit_hexsha": tag.target,
+        "tag": tag.name,
+    }
+    # events are built from tags we've just parsed, so validation is skipped
     if mtag.action == Action.REGISTER:
-        event = Registration(
-            artifact=mtag.name,
-            version=mtag.version,
-            created_at=mtag.created_at,
-            author=tag.tagger_name,
-            author_email=tag.tagger_email,
-            message=tag.message.strip(),
-            commit_hexsha=tag.target,
-            tag=tag.name,
-        )
+        event = Registration.construct(version=mtag.version, **fields)
     elif mtag.action == Action.DEREGISTER:
-        event = Deregistration(
-            artifact=mtag.name,
-            version=mtag.version,
-            created_at=mtag.created_at,
-            author=tag.tagger_name,
-            author_email=tag.tagger_email,
-            message=tag.message.strip(),
-            commit_hexsha=tag.target,
-            tag=tag.name,
-        )
+        event = Deregistration.construct(version=mtag.version, **fields)
     elif mtag.action in (Action.ASSIGN, Action.UNASSIGN):
         version = artifact.find_version(
             commit_hexsha=tag.target, create_new=True
         ).version  # type: ignore
         if mtag.action == Action.ASSIGN:
-            event = Assignment(
-                artifact=mtag.name,
-                version=version,
-                stage=mtag.stage,
-                created_at=mtag.created_at,
-                author=tag.tagger_name,
-                author_email=tag.tagger_email,
-                message=tag.message.strip(),
-                commit_hexsha=tag.target,
-                tag=tag.name,
-            )
+            event = Assignment.construct(version=version, stage=mtag.stage, **fields)
         else:
-            event = Unassignment(
-                artifact=mtag.name,
-                version=version,
-                stage=mtag.stage,
-                created_at=mtag.created_at,
-                author=tag.tagger_name,
-                author_email=tag.tagger_email,
-                message=tag.message.strip(),
-                commit_hexsha=tag.target,
-                tag=tag.name,
-            )
+            event = Unassignment.construct(version=version, stage=mtag.stage, **fields)
     elif mtag.action == Action.DEPRECATE:
-        event = Deprecation(
-            artifact=mtag.name,
-            created_at=mtag.created_at,
-            author=tag.tagger_name,
-            author_email=tag.tagger_email,
-            message=tag.message.strip(),
-            commit_hexsha=tag.target,
-            tag=tag.name,
-        )
+        event = Deprecation.construct(**fields)
     artifact.add_event(event)
     return artifact
 
 
 class TagManager(BaseManager):  # pylint: disable=abstract-method
-    def update_state(self, state: BaseRegistryState) -> BaseRegistryState:
+    def update_state(
+        self, state: BaseRegistryState, tags: Optional[Iterable[GitTag]] = None
+    ) -> BaseRegistryState:
+        """Index tags into the state.
+        `tags` can be passed to reuse tags already loaded and sorted by `find`"""
         # tags are sorted and then indexed by timestamp
         # this is important to check that history is not broken
-        for tag in find(scm=self.scm, action=self.actions):
+        for tag in find(
+            scm=self.scm, action=self.actions, tags=tags, presorted=tags is not None
+        ):
+            mtag = parse_tag(tag)
             state.update_artifact(
                 index_tag(
-                    state.find_artifact(parse_name(tag.name)["name"], create_new=True),
-                    tag,
+                    state.find_artifact(mtag.name, create_new=True), tag, mtag=mtag
                 )
             )
         return state
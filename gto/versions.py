@@ -1,11 +1,14 @@
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 
 import semver
 
+from gto.constants import semver_re
 from gto.exceptions import IncomparableVersions, InvalidVersion, WrongArgs
 
 
 class AbstractVersion:
+    __slots__ = ("version",)
+
     version: str
 
     def __init__(self, version) -> None:
@@ -28,19 +31,24 @@ class AbstractVersion:
         raise NotImplementedError
 
 
+@lru_cache(maxsize=2**12)
+def _parse_semver(version: str) -> "semver.VersionInfo":
+    # versions are compared while sorting, so the same strings are parsed many times
+    return semver.VersionInfo.parse(version[1:])
+
+
 @total_ordering
 class SemVer(AbstractVersion):
     """
     A subclass of Version which allows a "v" prefix
     """
 
+    __slots__ = ()
+
     @classmethod
     def is_valid(cls, version):
-        try:
-            cls.parse(version)
-            return True
-        except (InvalidVersion, ValueError, IndexError) as _:  # noqa: F841
-            return False
+        # same check as `parse` does, but without creating a VersionInfo
+        return isinstance(version, str) and semver_re.fullmatch(version) is not None
 
     @classmethod
     def parse(cls, version: str) -> "semver.VersionInfo":
@@ -57,7 +65,7 @@ class SemVer(AbstractVersion):
             raise InvalidVersion(
                 f"{version}: not a valid semantic version tag. Must start with 'v'"
             )
-        return semver.VersionInfo.parse(version[1:])
+        return _parse_semver(version)
 
     def __eq__(self, other):
         if isinstance(other, str):
@@ -288,6 +288,59 @@ def test_check_ref_multiple_showcase(scm: Git):
         assert events[0].ref == tag.name
 
 
+@pytest.mark.usefixtures("showcase")
+@pytest.mark.parametrize("name", ["rf", "rf@latest", "rf#production", "nn"])
+def test_show_versions_table_matches_full_output(tmp_dir: TmpDir, name: str):
+    versions = show(tmp_dir, name)
+    rows, _ = show(tmp_dir, name, table=True)
+    assert [(r["version"], r["stage"], r["created_at"], r["ref"]) for r in rows] == [
+        (
+            v["version"],
+            ", ".join(dict.fromkeys(s["stage"] for s in v["stages"])),
+            v["created_at"],
+            v["ref"],
+        )
+        for v in versions
+    ]
+
+
+@pytest.mark.usefixtures("showcase")
+def test_show_raw(tmp_dir: TmpDir):
+    versions = show(tmp_dir, "rf", raw=True)
+    assert {v.version for v in versions} == {
+        v["version"] for v in show(tmp_dir, "rf", deprecated=True)
+    }
+    with pytest.raises(WrongArgs):
+        show(tmp_dir, raw=True)
+
+
+@pytest.mark.usefixtures("showcase")
+@pytest.mark.parametrize("name", ["rf@latest", "rf#production", "rf@v1.2.3"])
+def test_show_raw_rejects_shortcut(tmp_dir: TmpDir, name: str):
+    with pytest.raises(WrongArgs):
+        show(tmp_dir, name, raw=True)
+
+
+@pytest.mark.usefixtures("showcase")
+@pytest.mark.parametrize(
+    "kwargs", [{"registered_only": True}, {"deprecated": True}, {"table": True}]
+)
+def test_show_raw_rejects_filters_and_table(tmp_dir: TmpDir, kwargs: dict):
+    with pytest.raises(WrongArgs):
+        show(tmp_dir, "rf", raw=True, **kwargs)
+
+
+@pytest.mark.usefixtures("showcase")
+def test_history_version_and_stage(tmp_dir: TmpDir):
+    events = gto.api.history(tmp_dir)
+    assert events
+    for event in events:
+        assert (event["version"] is None) == (event["event"] == "deprecation")
+        assert (event["stage"] is not None) == (
+            event["event"] in ("assignment", "unassignment")
+        )
+
+
 @pytest.mark.usefixtures("artifact")
 def test_check_ref_catch_the_bug(scm: Git):
     NAME = "artifact"
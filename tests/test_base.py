@@ -0,0 +1,85 @@
+from datetime import datetime
+
+from gto.base import (
+    Artifact,
+    Assignment,
+    Commit,
+    Deprecation,
+    Registration,
+    Unassignment,
+    Version,
+)
+
+
+def test_find_version_after_versions_are_replaced():
+    artifact = Artifact(artifact="model", versions=[])
+    v1 = artifact.find_version(commit_hexsha="a" * 40, create_new=True)
+    assert artifact.find_version(commit_hexsha="a" * 40, include_discovered=True) is v1
+    assert artifact.find_version(name="a" * 40, commit_hexsha="b" * 40) is None
+
+    v2 = Version(artifact="model", version="v1.0.0", commit_hexsha="b" * 40)
+    artifact.versions = [v2]
+    assert (
+        artifact.find_version(commit_hexsha="a" * 40, include_discovered=True) is None
+    )
+    assert artifact.find_version(name="v1.0.0", include_discovered=True) is v2
+
+
+def test_find_version_after_artifact_is_copied():
+    # pylint infers pydantic's `copy()` as returning a bare BaseModel
+    # pylint: disable=no-member
+    artifact = Artifact(artifact="model", versions=[])
+    artifact.find_version(commit_hexsha="a" * 40, create_new=True)
+    copied = artifact.copy()
+    v2 = copied.find_version(commit_hexsha="b" * 40, create_new=True)
+    assert copied.find_version(commit_hexsha="b" * 40, include_discovered=True) is v2
+    # shallow copies share `versions`, so the original sees the new version once
+    assert artifact.find_version(commit_hexsha="b" * 40, include_discovered=True) is v2
+    deep = artifact.copy(deep=True)
+    assert deep.find_version(commit_hexsha="b" * 40, include_discovered=True) == v2
+
+
+def test_get_tag_events_sorts_as_get_events():
+    artifact = Artifact(artifact="model", versions=[])
+    same_time = datetime(2020, 1, 1)
+    common = {
+        "artifact": "model",
+        "created_at": same_time,
+        "author": "author",
+        "author_email": "author@mail.com",
+        "message": "message",
+    }
+    for version, hexsha in [("v1.0.0", "a" * 40), ("v2.0.0", "b" * 40)]:
+        artifact.add_event(
+            Registration(version=version, commit_hexsha=hexsha, tag=version, **common)
+        )
+        for i, stage in enumerate(["dev", "prod", "dev"]):
+            artifact.add_event(
+                (Unassignment if i == 2 else Assignment)(
+                    version=version,
+                    stage=stage,
+                    commit_hexsha=hexsha,
+                    tag=f"{version}#{stage}#{i}",
+                    **common,
+                )
+            )
+        artifact.add_event(
+            Commit(
+                version=version,
+                commit_hexsha=hexsha,
+                enrichments=[],
+                committer="committer",
+                committer_email="committer@mail.com",
+                **common,
+            )
+        )
+    artifact.add_event(Deprecation(commit_hexsha="b" * 40, tag="deprecated", **common))
+
+    def key(e):
+        return e.created_at, e.priority
+
+    tag_events = artifact.get_tag_events()
+    assert not any(isinstance(e, Commit) for e in tag_events)
+    assert sorted(tag_events, key=key) == sorted(
+        [e for e in artifact.get_events() if not isinstance(e, Commit)], key=key
+    )
@@ -4,6 +4,7 @@ from gto.constants import (
     check_string_is_valid,
     fullname_in_tag_re,
     fullname_re,
+    parse_shortcut,
 )
 
 
@@ -73,3 +74,12 @@ def test_check_fullname_is_valid(name):
 )
 def test_check_fullname_in_tag_is_valid(name):
     assert check_string_is_valid(name, regex=fullname_in_tag_re)
+
+
+def test_parse_shortcut_is_cached_and_immutable():
+    shortcut = parse_shortcut("model@latest")
+    assert shortcut.name == "model"
+    assert shortcut.latest and shortcut.shortcut
+    assert parse_shortcut("model@latest") is shortcut
+    with pytest.raises(TypeError):
+        shortcut.latest = False
@@ -1,3 +1,4 @@
+import datetime
 from unittest.mock import MagicMock
 
 import pytest
@@ -6,7 +7,11 @@ from scmrepo.exceptions import SCMError
 from scmrepo.git import Git, SyncStatus
 
 from gto.exceptions import GTOException
-from gto.git_utils import git_add_and_commit_all_changes, git_push_tag
+from gto.git_utils import (
+    git_add_and_commit_all_changes,
+    git_datetime,
+    git_push_tag,
+)
 
 
 @pytest.fixture(name="mocked_scm")
@@ -93,3 +98,11 @@ def test_git_commit_specific_files_if_untracked_file_is_changed_then_new_commit(
     fs = scm.get_fs("HEAD")
     with fs.open("untracked-file", "r", encoding="utf-8") as f:
         assert f.read() == "test data"
+
+
+@pytest.mark.parametrize("offset", [0, 3600, -7 * 3600])
+def test_git_datetime(offset: int):
+    d = git_datetime(1650000000, offset)
+    assert d.timestamp() == 1650000000
+    assert d.utcoffset() == datetime.timedelta(seconds=offset)
+    assert git_datetime(1650000001, offset).tzinfo is d.tzinfo
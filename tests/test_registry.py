@@ -6,6 +6,7 @@ from pytest_mock import MockFixture
 from pytest_test_utils import TmpDir
 from scmrepo.git import Git
 
+from gto.exceptions import WrongArgs
 from gto.registry import GitRegistry
 
 from .utils import check_obj
@@ -461,6 +462,47 @@ def test_from_url_sets_cloned_property(tmp_dir: TmpDir, scm: Git, mocker: MockFi
         assert reg.cloned is True
 
 
+@pytest.mark.usefixtures("showcase")
+def test_cached_state(tmp_dir: TmpDir):
+    with GitRegistry.from_url(tmp_dir) as reg:
+        assert reg.get_state() is not reg.get_state()
+        with reg.cached_state():
+            state = reg.get_state()
+            assert reg.get_state() is state
+            assert reg.get_state(all_branches=True) is not state
+        assert reg.get_state() is not state
+
+
+@pytest.mark.usefixtures("showcase")
+def test_from_url_reuses_registry(tmp_dir: TmpDir):
+    with GitRegistry.from_url(tmp_dir) as reg, reg.cached_state():
+        state = reg.get_state()
+        with GitRegistry.from_url(reg) as same, same.cached_state():
+            assert same is reg
+            assert same.get_state() is state
+        # nested `cached_state` keeps the outer cache
+        assert reg.get_state() is state
+
+
+def test_from_url_rejects_config_and_branch_for_opened_registry(scm: Git):
+    with GitRegistry.from_url(scm) as reg:
+        with pytest.raises(WrongArgs), GitRegistry.from_url(reg, config=reg.config):
+            pass
+        with pytest.raises(WrongArgs), GitRegistry.from_url(reg, branch="main"):
+            pass
+
+
+@pytest.mark.usefixtures("showcase")
+def test_find_artifact_indexes_only_that_artifact(tmp_dir: TmpDir):
+    with GitRegistry.from_url(tmp_dir) as reg:
+        state = reg.get_state()
+        for name in state.get_artifacts():
+            assert (
+                reg.find_artifact(name).dict_state()
+                == state.find_artifact(name).dict_state()
+            )
+
+
 # Some method parameters (model names, versions, revs, etc) depend and set by
 # the `showcase` fixture setup in the conftest.py.
 @pytest.mark.parametrize(
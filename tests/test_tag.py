@@ -3,7 +3,15 @@ from scmrepo.git import Git
 
 from gto.constants import Action
 from gto.exceptions import RefNotFound, TagExists
-from gto.tag import create_tag, find, name_tag, parse_name, parse_tag
+from gto.tag import (
+    NAME_REFERENCE,
+    create_tag,
+    find,
+    name_tag,
+    parse_name,
+    parse_name_reference,
+    parse_tag,
+)
 
 
 def test_name_tag(scm: Git):
@@ -105,6 +113,19 @@ def test_parse_wrong_names(tag_name: str):
     assert not parse_name(tag_name, raise_on_fail=False)
 
 
+def test_parse_name_returns_copy():
+    parse_name("path@v1.2.3")["name"] = "other"
+    assert parse_name("path@v1.2.3")["name"] == "path"
+
+
+def test_parse_name_reference():
+    assert parse_name_reference("path") == (NAME_REFERENCE.NAME, "path")
+    assert parse_name_reference("path#prod") == (
+        NAME_REFERENCE.TAG,
+        {"name": "path", "action": Action.ASSIGN, "stage": "prod"},
+    )
+
+
 @pytest.mark.parametrize(
     "tag_name",
     [
@@ -150,6 +171,36 @@ def test_lightweight_tag(scm: Git):
     assert find(scm=scm) == []
 
 
+@pytest.mark.usefixtures("repo_with_commit")
+def test_find_filters(scm: Git):
+    for tag in ["nn@v1.0.0", "nn@v1.0.0!", "nn#prod#1", "nn#prod!#2", "rf@v1.0.0"]:
+        create_tag(scm, tag, rev="HEAD", message="msg")
+    create_tag(scm, "nn@deprecated", rev="HEAD", message="msg")
+    create_tag(scm, "nnn@v1.0.0", rev="HEAD", message="msg")
+
+    def names(**kwargs):
+        return sorted(t.name for t in find(scm=scm, **kwargs))
+
+    assert names(name="nn") == sorted(
+        ["nn@v1.0.0", "nn@v1.0.0!", "nn#prod#1", "nn#prod!#2", "nn@deprecated"]
+    )
+    assert names(name="nn", action=Action.REGISTER) == ["nn@v1.0.0"]
+    assert names(action=Action.UNASSIGN) == ["nn#prod!#2"]
+    assert names(action=frozenset((Action.CREATE, Action.DEPRECATE))) == [
+        "nn@deprecated"
+    ]
+
+
+@pytest.mark.usefixtures("repo_with_commit")
+def test_find_presorted(scm: Git):
+    for tag in ["nn@v1.0.0", "nn#prod#1", "rf@v1.0.0"]:
+        create_tag(scm, tag, rev="HEAD", message="msg")
+    tags = list(reversed(find(scm=scm)))
+    found = find(scm=scm, action=Action.REGISTER, tags=tags, presorted=True)
+    assert [t.name for t in found] == ["rf@v1.0.0", "nn@v1.0.0"]
+    assert found[0] is tags[0]
+
+
 @pytest.mark.usefixtures("repo_with_commit")
 def test_parse_tag_created_at_timezone(scm: Git):
     create_tag(scm, "nn#prod", rev="HEAD", message="msg")